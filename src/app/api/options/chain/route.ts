@@ -1,24 +1,42 @@
 /**
  * Options Chain API Route
- * Proxies requests to Python FastAPI options service
+ * Serves chains from the shared Yahoo Finance layer (cache, request
+ * coalescing and rate limiting live in src/lib/yahooFinance.ts)
  *
  * GET /api/options/chain?ticker=AAPL&expiration=2025-11-15
  * GET /api/options/chain?ticker=AAPL&expiration=2025-11-15&minStrike=170&maxStrike=180
+ *
+ * Returns 404 when Yahoo answers with no contracts for the ticker/expiration,
+ * 502 when the Yahoo request fails (including symbols Yahoo rejects with an
+ * error) and 504 when it times out.
  */
 
 import { NextRequest, NextResponse } from 'next/server';
+import { getOptionsChain, type OptionsChain } from '@/lib/yahooFinance';
 
 export const dynamic = 'force-dynamic';
 
-const OPTIONS_SERVICE_URL = process.env.OPTIONS_SERVICE_URL || 'http://localhost:8000';
+// Serialized bodies of full chains, keyed by chain object. Unwindowed
+// requests get the cached chain itself until its cache entry expires, so
+// repeat hits reuse the JSON instead of re-stringifying the full chain.
+const serializedChains = new WeakMap<OptionsChain, string>();
+
+function serializeFullChain(chain: OptionsChain): string {
+  let body = serializedChains.get(chain);
+  if (body === undefined) {
+    body = JSON.stringify(chain);
+    serializedChains.set(chain, body);
+  }
+  return body;
+}
 
 export async function GET(request: NextRequest) {
   try {
     const { searchParams } = new URL(request.url);
     const ticker = searchParams.get('ticker');
     const expiration = searchParams.get('expiration');
-    const minStrike = searchParams.get('minStrike');
-    const maxStrike = searchParams.get('maxStrike');
+    const minStrikeParam = searchParams.get('minStrike');
+    const maxStrikeParam = searchParams.get('maxStrike');
 
     // Validate required parameters
     if (!ticker) {
@@ -37,65 +55,60 @@ export async function GET(request: NextRequest) {
 
     // Validate expiration date format
     const dateRegex = /^\d{4}-\d{2}-\d{2}$/;
-    if (!dateRegex.test(expiration)) {
+    const expirationDate = new Date(`${expiration}T00:00:00Z`);
+    if (!dateRegex.test(expiration) || isNaN(expirationDate.getTime())) {
       return NextResponse.json(
         { error: 'Invalid expiration date format. Use YYYY-MM-DD' },
         { status: 400 }
       );
     }
 
-    // Build query string
-    const queryParams = new URLSearchParams({
-      ticker,
-      expiration,
-    });
-
-    if (minStrike) {
-      queryParams.append('minStrike', minStrike);
-    }
-
-    if (maxStrike) {
-      queryParams.append('maxStrike', maxStrike);
+    // Validate optional strike window
+    const minStrike = minStrikeParam ? Number(minStrikeParam) : undefined;
+    const maxStrike = maxStrikeParam ? Number(maxStrikeParam) : undefined;
+    if (
+      (minStrike !== undefined && !Number.isFinite(minStrike)) ||
+      (maxStrike !== undefined && !Number.isFinite(maxStrike))
+    ) {
+      return NextResponse.json(
+        { error: 'Invalid strike range. minStrike and maxStrike must be numbers' },
+        { status: 400 }
+      );
     }
 
-    // Call Python FastAPI service
-    const response = await fetch(
-      `${OPTIONS_SERVICE_URL}/api/options/chain?${queryParams.toString()}`,
-      {
-        method: 'GET',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        // Add timeout (longer for chain data)
-        signal: AbortSignal.timeout(15000), // 15 second timeout
-      }
-    );
+    const symbol = ticker.toUpperCase();
+    const chain = await getOptionsChain(symbol, expirationDate, { minStrike, maxStrike });
 
-    if (!response.ok) {
-      const errorData = await response.json().catch(() => ({ detail: 'Unknown error' }));
+    if (!chain) {
       return NextResponse.json(
-        { error: errorData.detail || 'Failed to fetch options chain' },
-        { status: response.status }
+        { error: `No options chain found for ${symbol} expiring ${expiration}` },
+        { status: 404 }
       );
     }
 
-    const data = await response.json();
-    return NextResponse.json(data);
+    // Windowed chains are fresh objects every request, so only full chains
+    // are worth memoizing
+    const windowed = minStrike !== undefined || maxStrike !== undefined;
+    const body = windowed ? JSON.stringify(chain) : serializeFullChain(chain);
+
+    return new NextResponse(body, {
+      headers: { 'Content-Type': 'application/json' },
+    });
 
   } catch (error) {
     console.error('Options chain API error:', error);
 
     // Check if it's a timeout error
-    if (error instanceof Error && error.name === 'AbortError') {
+    if (error instanceof Error && error.name === 'TimeoutError') {
       return NextResponse.json(
-        { error: 'Request timeout - options service may be unavailable' },
+        { error: 'Request timeout - Yahoo Finance may be unavailable' },
         { status: 504 }
       );
     }
 
     return NextResponse.json(
-      { error: 'Internal server error fetching options chain' },
-      { status: 500 }
+      { error: 'Failed to fetch options chain from Yahoo Finance' },
+      { status: 502 }
     );
   }
 }
@@ -1,15 +1,35 @@
 /**
  * Options Expirations API Route
- * Proxies requests to Python FastAPI options service
+ * Serves expirations from the shared Yahoo Finance layer (cache, request
+ * coalescing and rate limiting live in src/lib/yahooFinance.ts)
  *
  * GET /api/options/expirations?ticker=AAPL
+ *
+ * Returns 404 when Yahoo answers with no expirations for the ticker, 502 when
+ * the Yahoo request fails (including symbols Yahoo rejects with an error)
+ * and 504 when it times out.
  */
 
 import { NextRequest, NextResponse } from 'next/server';
+import { getOptionsExpirations } from '@/lib/yahooFinance';
 
 export const dynamic = 'force-dynamic';
 
-const OPTIONS_SERVICE_URL = process.env.OPTIONS_SERVICE_URL || 'http://localhost:8000';
+// Serialized bodies keyed by the cached expirations array, which the Yahoo
+// layer returns by reference until its cache entry expires
+const serializedExpirations = new WeakMap<Date[], string>();
+
+function serializeExpirations(symbol: string, expirations: Date[]): string {
+  let body = serializedExpirations.get(expirations);
+  if (body === undefined) {
+    body = JSON.stringify({
+      ticker: symbol,
+      expirations: expirations.map((date) => date.toISOString().split('T')[0]),
+    });
+    serializedExpirations.set(expirations, body);
+  }
+  return body;
+}
 
 export async function GET(request: NextRequest) {
   try {
@@ -23,44 +43,34 @@ export async function GET(request: NextRequest) {
       );
     }
 
-    // Call Python FastAPI service
-    const response = await fetch(
-      `${OPTIONS_SERVICE_URL}/api/options/expirations?ticker=${encodeURIComponent(ticker)}`,
-      {
-        method: 'GET',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        // Add timeout
-        signal: AbortSignal.timeout(10000), // 10 second timeout
-      }
-    );
+    const symbol = ticker.toUpperCase();
+    const expirations = await getOptionsExpirations(symbol);
 
-    if (!response.ok) {
-      const errorData = await response.json().catch(() => ({ detail: 'Unknown error' }));
+    if (!expirations) {
       return NextResponse.json(
-        { error: errorData.detail || 'Failed to fetch options expirations' },
-        { status: response.status }
+        { error: `No options expirations found for ${symbol}` },
+        { status: 404 }
       );
     }
 
-    const data = await response.json();
-    return NextResponse.json(data);
+    return new NextResponse(serializeExpirations(symbol, expirations), {
+      headers: { 'Content-Type': 'application/json' },
+    });
 
   } catch (error) {
     console.error('Options expirations API error:', error);
 
     // Check if it's a timeout error
-    if (error instanceof Error && error.name === 'AbortError') {
+    if (error instanceof Error && error.name === 'TimeoutError') {
       return NextResponse.json(
-        { error: 'Request timeout - options service may be unavailable' },
+        { error: 'Request timeout - Yahoo Finance may be unavailable' },
         { status: 504 }
       );
     }
 
     return NextResponse.json(
-      { error: 'Internal server error fetching options expirations' },
-      { status: 500 }
+      { error: 'Failed to fetch options expirations from Yahoo Finance' },
+      { status: 502 }
     );
   }
 }
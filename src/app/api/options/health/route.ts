@@ -2,6 +2,10 @@
  * Options Service Health Check API Route
  * Checks if Python FastAPI options service is available
  *
+ * The service now only backs quote lookups for market context
+ * (src/lib/marketData.ts, src/lib/contextSurfacing.ts). The options chain and
+ * expirations routes read Yahoo Finance in-process and do not depend on it.
+ *
  * GET /api/options/health
  */
 
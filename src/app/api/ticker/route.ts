@@ -19,6 +19,23 @@ const mockResults = [
   { symbol: 'NFLX', name: 'Netflix, Inc.', exchange: 'NASDAQ' },
 ];
 
+// Lowercased once at load so a keystroke doesn't re-lowercase the whole list
+const mockSearchIndex = mockResults.map(item => ({
+  item,
+  symbol: item.symbol.toLowerCase(),
+  name: item.name.toLowerCase(),
+}));
+
+/**
+ * Match mock results by symbol or company name substring
+ */
+function filterMockResults(query: string) {
+  const needle = query.toLowerCase();
+  return mockSearchIndex
+    .filter(entry => entry.symbol.includes(needle) || entry.name.includes(needle))
+    .map(entry => entry.item);
+}
+
 /**
  * Ticker search endpoint
  * GET /api/ticker?q={query}
@@ -37,10 +54,7 @@ export async function GET(request: NextRequest) {
 
     // Use mock data if explicitly enabled
     if (USE_MOCK_DATA) {
-      const filtered = mockResults.filter(item =>
-        item.symbol.toLowerCase().includes(q.toLowerCase()) ||
-        item.name.toLowerCase().includes(q.toLowerCase())
-      );
+      const filtered = filterMockResults(q);
       return NextResponse.json({ results: filtered });
     }
 
@@ -50,10 +64,7 @@ export async function GET(request: NextRequest) {
     // If no results from real API, fall back to mock data
     if (!results || results.length === 0) {
       logger.warn('No results from Yahoo Finance, using mock data', { query: q });
-      const filtered = mockResults.filter(item =>
-        item.symbol.toLowerCase().includes(q.toLowerCase()) ||
-        item.name.toLowerCase().includes(q.toLowerCase())
-      );
+      const filtered = filterMockResults(q);
       return NextResponse.json({ results: filtered });
     }
 
@@ -63,10 +74,7 @@ export async function GET(request: NextRequest) {
     logger.error('Error in ticker search endpoint', error, { query: q });
 
     // Return mock data as fallback on error
-    const filtered = mockResults.filter(item =>
-      item.symbol.toLowerCase().includes(q.toLowerCase()) ||
-      item.name.toLowerCase().includes(q.toLowerCase())
-    );
+    const filtered = filterMockResults(q);
     return NextResponse.json({ results: filtered });
   }
 }
\ No newline at end of file
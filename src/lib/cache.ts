@@ -1,15 +1,30 @@
 /**
  * Simple in-memory cache with TTL support
- * Used for caching market data from Yahoo Finance
+ * Used for caching market data from Yahoo Finance, import sessions and OCR
+ * results
+ *
+ * A cache can be bounded: once it holds more than maxEntries, the least
+ * recently used entry is evicted. Expired entries are swept at most once per
+ * SWEEP_INTERVAL_MS so a full cache does not rescan on every write.
  */
 
+import { toZonedTime } from 'date-fns-tz';
+
 interface CacheEntry<T> {
   value: T;
   expiresAt: number;
 }
 
-class Cache {
+const MARKET_DATA_MAX_ENTRIES = 1000;
+const SWEEP_INTERVAL_MS = 60 * 1000;
+
+export class Cache {
+  // Map iteration order doubles as LRU order (oldest first)
   private store: Map<string, CacheEntry<unknown>> = new Map();
+  private inflight: Map<string, Promise<unknown>> = new Map();
+  private lastSweepAt = 0;
+
+  constructor(private maxEntries: number = Infinity) {}
 
   /**
    * Get a value from the cache
@@ -27,6 +42,10 @@ class Cache {
       return null;
     }
 
+    // Mark as most recently used
+    this.store.delete(key);
+    this.store.set(key, entry);
+
     return entry.value;
   }
 
@@ -37,10 +56,50 @@ class Cache {
    * @param ttl Time to live in milliseconds
    */
   set<T>(key: string, value: T, ttl: number): void {
+    this.store.delete(key);
     this.store.set(key, {
       value,
       expiresAt: Date.now() + ttl,
     });
+
+    if (this.store.size > this.maxEntries) {
+      this.evict();
+    }
+  }
+
+  /**
+   * Get a value from the cache, fetching and storing it on a miss.
+   * Concurrent misses for the same key share one in-flight fetch, so a
+   * burst of identical requests only hits the upstream once.
+   * Null results are returned to every waiter but not cached.
+   * @param key Cache key
+   * @param ttl Time to live in milliseconds
+   * @param fetcher Loads the value on a miss
+   */
+  getOrFetch<T>(key: string, ttl: number, fetcher: () => Promise<T | null>): Promise<T | null> {
+    const cached = this.get<T>(key);
+    if (cached !== null) {
+      return Promise.resolve(cached);
+    }
+
+    const pending = this.inflight.get(key) as Promise<T | null> | undefined;
+    if (pending) {
+      return pending;
+    }
+
+    const request = fetcher()
+      .then((value) => {
+        if (value !== null) {
+          this.set(key, value, ttl);
+        }
+        return value;
+      })
+      .finally(() => {
+        this.inflight.delete(key);
+      });
+
+    this.inflight.set(key, request);
+    return request;
   }
 
   /**
@@ -55,6 +114,7 @@ class Cache {
    */
   clearAll(): void {
     this.store.clear();
+    this.lastSweepAt = 0;
   }
 
   /**
@@ -63,13 +123,37 @@ class Cache {
   size(): number {
     return this.store.size;
   }
+
+  /**
+   * Drop least recently used entries until within bounds, sweeping expired
+   * entries first when the last sweep is older than SWEEP_INTERVAL_MS
+   */
+  private evict(): void {
+    const now = Date.now();
+    if (now - this.lastSweepAt >= SWEEP_INTERVAL_MS) {
+      this.lastSweepAt = now;
+      this.store.forEach((entry, key) => {
+        if (now > entry.expiresAt) this.store.delete(key);
+      });
+    }
+
+    const keys = this.store.keys();
+    while (this.store.size > this.maxEntries) {
+      this.store.delete(keys.next().value as string);
+    }
+  }
 }
 
-// Singleton cache instance
+// Singleton cache instance for import sessions and OCR results. Unbounded so
+// pending user state is only dropped by its TTL.
 const cache = new Cache();
 export default cache;
 export { cache };
 
+// Market data keys come from unauthenticated lookups (any ticker, query or
+// expiration), so they get their own bounded cache and cannot evict user state
+export const marketDataCache = new Cache(MARKET_DATA_MAX_ENTRIES);
+
 /**
  * Cache TTL constants (in milliseconds)
  */
@@ -99,6 +183,13 @@ export const CacheKeys = {
   importPreview: (importToken: string) => `import_preview_${importToken}`,
 } as const;
 
+// US equity market hours are defined in Eastern Time regardless of host timezone
+const MARKET_TIMEZONE = 'America/New_York';
+
+// TTL only changes at minute boundaries, so reuse it within the same second
+let priceCacheTTLSecond = -1;
+let priceCacheTTL: number = CacheTTL.ONE_HOUR;
+
 /**
  * Get the appropriate cache TTL for price data based on market hours
  * During market hours: 5 minutes
@@ -106,7 +197,16 @@ export const CacheKeys = {
  * Weekends: 24 hours
  */
 export function getPriceCacheTTL(): number {
-  const now = new Date();
+  const second = Math.floor(Date.now() / 1000);
+  if (second !== priceCacheTTLSecond) {
+    priceCacheTTLSecond = second;
+    priceCacheTTL = computePriceCacheTTL(new Date(second * 1000));
+  }
+  return priceCacheTTL;
+}
+
+function computePriceCacheTTL(date: Date): number {
+  const now = toZonedTime(date, MARKET_TIMEZONE);
   const day = now.getDay();
   const hour = now.getHours();
   const minute = now.getMinutes();
@@ -117,7 +217,7 @@ export function getPriceCacheTTL(): number {
     return CacheTTL.ONE_DAY;
   }
 
-  // Market hours: 9:30 AM - 4:00 PM ET (assuming local time is ET)
+  // Market hours: 9:30 AM - 4:00 PM ET
   const marketOpen = 9 * 60 + 30; // 9:30 AM
   const marketClose = 16 * 60; // 4:00 PM
 
@@ -174,8 +174,10 @@ export async function getTickerMarketData(ticker: string): Promise<TickerContext
   }
 
   try {
-    const response = await fetch(`${serviceUrl}/api/quote?ticker=${ticker}`, {
+    const response = await fetch(`${serviceUrl}/api/quote?ticker=${encodeURIComponent(ticker)}`, {
       next: { revalidate: 300 }, // Cache for 5 minutes
+      // Don't let a hung service stall callers
+      signal: AbortSignal.timeout(10000), // 10 second timeout
     });
 
     if (!response.ok) {
@@ -1,5 +1,51 @@
 import { logger } from './logger';
 
+const TRADING_DAYS_PER_YEAR = 252;
+
+/**
+ * Prices must be positive finite numbers for log returns to be meaningful
+ */
+function isValidPrice(price: number): boolean {
+  return isFinite(price) && price > 0;
+}
+
+/**
+ * Close-to-close log returns: ln(P_t / P_{t-1})
+ * Invalid prices propagate as NaN/Infinity and are rejected by hvFromLogReturns.
+ */
+function toLogReturns(closes: number[]): number[] {
+  const logReturns = new Array<number>(closes.length - 1);
+  for (let i = 1; i < closes.length; i++) {
+    logReturns[i - 1] = Math.log(closes[i] / closes[i - 1]);
+  }
+  return logReturns;
+}
+
+/**
+ * Annualized HV percentage from the last `count` log returns
+ * Sample standard deviation computed in place, without intermediate arrays.
+ */
+function hvFromLogReturns(logReturns: number[], count: number): number | null {
+  const start = logReturns.length - count;
+
+  let sum = 0;
+  for (let i = start; i < logReturns.length; i++) {
+    sum += logReturns[i];
+  }
+  const mean = sum / count;
+
+  let sumSquaredDiffs = 0;
+  for (let i = start; i < logReturns.length; i++) {
+    const diff = logReturns[i] - mean;
+    sumSquaredDiffs += diff * diff;
+  }
+  const stdev = Math.sqrt(sumSquaredDiffs / (count - 1));
+
+  // Annualize by sqrt(trading days) and convert to percentage
+  const hvPercent = stdev * Math.sqrt(TRADING_DAYS_PER_YEAR) * 100;
+  return isFinite(hvPercent) ? hvPercent : null;
+}
+
 /**
  * Calculate Historical Volatility using close-to-close log returns
  * Formula: HV = stdev(ln(P_t/P_{t-1})) * sqrt(252) * 100
@@ -17,41 +63,18 @@ export function calculateHV(closes: number[]): number | null {
   }
 
   // Validate all prices are positive numbers
-  const invalidPrices = closes.filter(p => !isFinite(p) || p <= 0);
+  const invalidPrices = closes.filter(p => !isValidPrice(p));
   if (invalidPrices.length > 0) {
     logger.error('calculateHV: invalid prices detected', { invalidPrices });
     return null;
   }
 
-  // Calculate log returns: ln(P_t / P_{t-1})
-  const logReturns: number[] = [];
-  for (let i = 1; i < closes.length; i++) {
-    const logReturn = Math.log(closes[i] / closes[i - 1]);
-    logReturns.push(logReturn);
-  }
-
-  logger.debug('calculateHV log returns', { 
-    count: logReturns.length,
-    sample: logReturns.slice(0, 3).map(r => r.toFixed(6))
-  });
-
-  // Calculate standard deviation
-  const mean = logReturns.reduce((sum, r) => sum + r, 0) / logReturns.length;
-  const squaredDiffs = logReturns.map(r => Math.pow(r - mean, 2));
-  const variance = squaredDiffs.reduce((sum, d) => sum + d, 0) / (logReturns.length - 1);
-  const stdev = Math.sqrt(variance);
-
-  // Annualize: multiply by sqrt(252) for trading days
-  const annualizedVol = stdev * Math.sqrt(252);
-  
-  // Convert to percentage
-  const hvPercent = annualizedVol * 100;
+  const logReturns = toLogReturns(closes);
+  const hvPercent = hvFromLogReturns(logReturns, logReturns.length);
 
   logger.debug('calculateHV result', {
-    mean: mean.toFixed(6),
-    stdev: stdev.toFixed(6),
-    annualized: annualizedVol.toFixed(4),
-    hvPercent: hvPercent.toFixed(2)
+    returns: logReturns.length,
+    hvPercent: hvPercent?.toFixed(2)
   });
 
   return hvPercent;
@@ -75,16 +98,30 @@ export function calculateHVMetrics(closes: number[]): HVResult {
     calculatedAt: new Date()
   };
 
-  // Calculate HV20 (last 20 days)
+  // Log returns for the last 30 days are computed once and shared by both
+  // windows. HV20 uses the last 20 closes (19 returns), HV30 the last 30.
   if (closes.length >= 20) {
-    const last20 = closes.slice(-20);
-    result.hv20 = calculateHV(last20);
-  }
+    const recent = closes.slice(-30);
+
+    // A window is usable only if it starts after the newest invalid price
+    let newestInvalid = -1;
+    for (let i = 0; i < recent.length; i++) {
+      if (!isValidPrice(recent[i])) newestInvalid = i;
+    }
+    if (newestInvalid >= 0) {
+      logger.error('calculateHVMetrics: invalid prices detected', {
+        invalidPrices: recent.filter(p => !isValidPrice(p))
+      });
+    }
+
+    const logReturns = toLogReturns(recent);
+    if (newestInvalid < recent.length - 20) {
+      result.hv20 = hvFromLogReturns(logReturns, 19);
+    }
 
-  // Calculate HV30 (last 30 days)
-  if (closes.length >= 30) {
-    const last30 = closes.slice(-30);
-    result.hv30 = calculateHV(last30);
+    if (closes.length >= 30 && newestInvalid < 0) {
+      result.hv30 = hvFromLogReturns(logReturns, 29);
+    }
   }
 
   logger.debug('calculateHVMetrics result', result);
@@ -55,8 +55,10 @@ async function fetchQuoteFromYFinance(ticker: string): Promise<MarketQuote | nul
   }
 
   try {
-    const response = await fetch(`${serviceUrl}/api/quote?ticker=${ticker}`, {
+    const response = await fetch(`${serviceUrl}/api/quote?ticker=${encodeURIComponent(ticker)}`, {
       next: { revalidate: 300 }, // Cache for 5 minutes
+      // Don't let a hung service stall callers
+      signal: AbortSignal.timeout(10000), // 10 second timeout
     });
 
     if (!response.ok) {
@@ -1,6 +1,6 @@
 import yahooFinance from 'yahoo-finance2';
 import { logger } from './logger';
-import cache, { CacheKeys, CacheTTL, getPriceCacheTTL } from './cache';
+import { marketDataCache as cache, CacheKeys, CacheTTL, getPriceCacheTTL } from './cache';
 
 /**
  * Yahoo Finance API Integration
@@ -12,6 +12,107 @@ import cache, { CacheKeys, CacheTTL, getPriceCacheTTL } from './cache';
  * - Graceful fallbacks
  */
 
+// Outbound request budget shared by every Yahoo call in this module.
+// Bursts of cache misses queue here instead of tripping Yahoo's per-IP limit:
+// a token bucket caps the request rate and a semaphore caps how many
+// requests are in flight at once. A slot is held until the upstream request
+// settles; requests that exceed the time limit are aborted so their slot
+// comes back.
+const YAHOO_REQUESTS_PER_SECOND = 5;
+const YAHOO_MAX_CONCURRENT_REQUESTS = 8;
+const YAHOO_REQUEST_TIMEOUT_MS = 15000;
+let yahooTokens = YAHOO_REQUESTS_PER_SECOND;
+let yahooTokensUpdatedAt = Date.now();
+let yahooActiveRequests = 0;
+const yahooSlotWaiters: Array<() => void> = [];
+
+/**
+ * Wait until fewer than YAHOO_MAX_CONCURRENT_REQUESTS calls are in flight
+ */
+async function acquireYahooSlot(): Promise<void> {
+  if (yahooActiveRequests < YAHOO_MAX_CONCURRENT_REQUESTS) {
+    yahooActiveRequests++;
+    return;
+  }
+  await new Promise<void>((resolve) => yahooSlotWaiters.push(resolve));
+}
+
+/**
+ * Hand the slot to the next waiter, or free it
+ */
+function releaseYahooSlot(): void {
+  const next = yahooSlotWaiters.shift();
+  if (next) {
+    next();
+  } else {
+    yahooActiveRequests--;
+  }
+}
+
+/**
+ * Wait for a token from the Yahoo request bucket
+ */
+async function acquireYahooToken(): Promise<void> {
+  for (;;) {
+    const now = Date.now();
+    yahooTokens = Math.min(
+      YAHOO_REQUESTS_PER_SECOND,
+      yahooTokens + ((now - yahooTokensUpdatedAt) / 1000) * YAHOO_REQUESTS_PER_SECOND
+    );
+    yahooTokensUpdatedAt = now;
+
+    if (yahooTokens >= 1) {
+      yahooTokens -= 1;
+      return;
+    }
+
+    const waitMs = ((1 - yahooTokens) / YAHOO_REQUESTS_PER_SECOND) * 1000;
+    await new Promise((resolve) => setTimeout(resolve, waitMs));
+  }
+}
+
+/**
+ * Reject with a TimeoutError if the request has not settled in time, then
+ * abort it through the controller whose signal the request was given
+ */
+function withYahooTimeout<T>(request: Promise<T>, controller: AbortController): Promise<T> {
+  let timer: ReturnType<typeof setTimeout> | undefined;
+  const timeout = new Promise<never>((_, reject) => {
+    timer = setTimeout(() => {
+      const error = new Error('Yahoo Finance request timed out');
+      error.name = 'TimeoutError';
+      // Reject first so callers see the timeout rather than the abort
+      reject(error);
+      controller.abort(error);
+    }, YAHOO_REQUEST_TIMEOUT_MS);
+  });
+
+  return Promise.race([request, timeout]).finally(() => clearTimeout(timer));
+}
+
+/**
+ * Run a Yahoo call once a concurrency slot and a rate-limit token are free
+ * The call receives an AbortSignal to pass to yahoo-finance2 as
+ * fetchOptions. Its slot is released when the upstream request settles,
+ * not when the caller stops waiting. Exported for tests.
+ */
+export async function withYahooRateLimit<T>(call: (signal: AbortSignal) => Promise<T>): Promise<T> {
+  await acquireYahooSlot();
+  await acquireYahooToken();
+
+  const controller = new AbortController();
+  let request: Promise<T>;
+  try {
+    request = call(controller.signal);
+  } catch (error) {
+    releaseYahooSlot();
+    throw error;
+  }
+
+  request.then(releaseYahooSlot, releaseYahooSlot);
+  return withYahooTimeout(request, controller);
+}
+
 export interface HistoricalPrice {
   date: Date;
   close: number;
@@ -55,6 +156,11 @@ export interface OptionsContract {
   lastTradeDate: Date;
 }
 
+export interface StrikeRange {
+  minStrike?: number;
+  maxStrike?: number;
+}
+
 export interface OptionsChain {
   ticker: string;
   expirationDate: Date;
@@ -92,12 +198,14 @@ export async function fetchHistoricalPrices(
     startDate.setDate(startDate.getDate() - days - 10); // Fetch extra days to account for weekends/holidays
 
     // Fetch historical data
-    // @ts-expect-error - yahoo-finance2 has complex type overloads that conflict
-    const result = await yahooFinance.historical(ticker, {
-      period1: startDate,
-      period2: endDate,
-      interval: '1d' as const, // Daily data
-    });
+    const result = await withYahooRateLimit((signal) =>
+      // @ts-expect-error - yahoo-finance2 has complex type overloads that conflict
+      yahooFinance.historical(ticker, {
+        period1: startDate,
+        period2: endDate,
+        interval: '1d' as const, // Daily data
+      }, { fetchOptions: { signal } })
+    );
 
     if (!result || result.length === 0) {
       logger.warn('No historical data returned', { ticker, days });
@@ -158,6 +266,25 @@ export async function fetchHistoricalPrices(
   }
 }
 
+// Only the quote fields TickerInfo reads, so Yahoo skips the rest of the payload
+const TICKER_INFO_FIELDS = [
+  'symbol',
+  'longName',
+  'shortName',
+  'fullExchangeName',
+  'exchange',
+  'currency',
+  'regularMarketPrice',
+  'regularMarketPreviousClose',
+  'regularMarketChange',
+  'regularMarketChangePercent',
+  'regularMarketVolume',
+  'averageDailyVolume10Day',
+  'marketCap',
+  'fiftyTwoWeekHigh',
+  'fiftyTwoWeekLow',
+];
+
 /**
  * Get detailed ticker/quote information
  *
@@ -176,8 +303,10 @@ export async function getTickerInfo(ticker: string): Promise<TickerInfo | null>
   try {
     logger.debug('Fetching ticker info from Yahoo Finance', { ticker });
 
-    // @ts-expect-error - yahoo-finance2 has complex type overloads that conflict
-    const result = await yahooFinance.quote(ticker);
+    const result = await withYahooRateLimit((signal) =>
+      // @ts-expect-error - yahoo-finance2 has complex type overloads that conflict
+      yahooFinance.quote(ticker, { fields: TICKER_INFO_FIELDS }, { fetchOptions: { signal } })
+    );
 
     if (!result) {
       logger.warn('No quote data returned', { ticker });
@@ -246,8 +375,10 @@ export async function searchTickers(query: string): Promise<SearchResult[]> {
   try {
     logger.debug('Searching tickers on Yahoo Finance', { query });
 
-    // @ts-expect-error - yahoo-finance2 has complex type overloads that conflict
-    const result = await yahooFinance.search(query);
+    const result = await withYahooRateLimit((signal) =>
+      // @ts-expect-error - yahoo-finance2 has complex type overloads that conflict
+      yahooFinance.search(query, {}, { fetchOptions: { signal } })
+    );
 
     if (!result || !result.quotes || result.quotes.length === 0) {
       logger.debug('No search results', { query });
@@ -319,46 +450,55 @@ export async function validateTicker(ticker: string): Promise<boolean> {
 }
 
 /**
- * Get available expiration dates for options on a ticker
- *
- * @param ticker Stock symbol (e.g., 'AAPL', 'SPY')
- * @returns Array of expiration dates or null on error
+ * Normalize Yahoo expiration dates
+ * yahoo-finance2 returns Date objects; raw epoch seconds are converted.
  */
-export async function getOptionsExpirations(ticker: string): Promise<Date[] | null> {
-  const cacheKey = `options_expirations_${ticker}`;
-
-  // Check cache
-  const cached = cache.get<Date[]>(cacheKey);
-  if (cached) {
-    return cached;
-  }
+function toExpirationDates(expirationDates: Array<Date | number> | undefined): Date[] {
+  return (expirationDates || []).map((value) =>
+    value instanceof Date ? value : new Date(value * 1000)
+  );
+}
 
-  try {
-    logger.debug('Fetching options expirations from Yahoo Finance', { ticker });
+/**
+ * Fetch available expiration dates from Yahoo Finance (uncached)
+ */
+async function fetchOptionsExpirations(ticker: string): Promise<Date[] | null> {
+  logger.debug('Fetching options expirations from Yahoo Finance', { ticker });
 
+  const result = await withYahooRateLimit((signal) =>
     // @ts-expect-error - yahoo-finance2 has complex type overloads that conflict
-    const result = await yahooFinance.options(ticker);
+    yahooFinance.options(ticker, {}, { fetchOptions: { signal } })
+  );
 
-    if (!result || !result.expirationDates || result.expirationDates.length === 0) {
-      logger.warn('No expiration dates found', { ticker });
-      return null;
-    }
+  if (!result || !result.expirationDates || result.expirationDates.length === 0) {
+    logger.warn('No expiration dates found', { ticker });
+    return null;
+  }
 
-    // Convert timestamps to Date objects
-    // External Yahoo Finance API response type is untyped - explicit any needed for type assertion
-    // eslint-disable-next-line @typescript-eslint/no-explicit-any
-    const expirations = (result.expirationDates as any[]).map((timestamp: number) => new Date(timestamp * 1000));
+  const expirations = toExpirationDates(result.expirationDates);
 
-    // Cache for 1 hour (expirations don't change frequently)
-    cache.set(cacheKey, expirations, CacheTTL.ONE_HOUR);
+  logger.info('Options expirations fetched successfully', {
+    ticker,
+    count: expirations.length,
+    nearest: expirations[0]?.toISOString().split('T')[0],
+  });
 
-    logger.info('Options expirations fetched successfully', {
-      ticker,
-      count: expirations.length,
-      nearest: expirations[0]?.toISOString().split('T')[0],
-    });
+  return expirations;
+}
+
+/**
+ * Get available expiration dates for options on a ticker
+ *
+ * @param ticker Stock symbol (e.g., 'AAPL', 'SPY')
+ * @returns Array of expiration dates, or null if Yahoo lists none
+ * @throws When the Yahoo request fails and no cached copy is available
+ */
+export async function getOptionsExpirations(ticker: string): Promise<Date[] | null> {
+  const cacheKey = CacheKeys.optionsExpirations(ticker);
 
-    return expirations;
+  try {
+    // Cache for 1 hour (expirations don't change frequently)
+    return await cache.getOrFetch(cacheKey, CacheTTL.ONE_HOUR, () => fetchOptionsExpirations(ticker));
   } catch (error) {
     logger.error('Error fetching options expirations', error, { ticker });
 
@@ -369,8 +509,168 @@ export async function getOptionsExpirations(ticker: string): Promise<Date[] | nu
       return staleData;
     }
 
+    throw error;
+  }
+}
+
+/**
+ * Build the cache key for an options chain. Strike windows are not part of
+ * the key: the full chain is cached once and filtered per request.
+ */
+function optionsChainCacheKey(ticker: string, expiration: Date): string {
+  const expirationStr = Math.floor(expiration.getTime() / 1000).toString();
+  return CacheKeys.optionsChain(ticker, expirationStr);
+}
+
+/**
+ * Index of the first contract with strike >= target (or > target when
+ * `pastEqual` is set). Contracts must be sorted by strike.
+ */
+function strikeBound(contracts: OptionsContract[], target: number, pastEqual: boolean): number {
+  let lo = 0;
+  let hi = contracts.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1;
+    const strike = contracts[mid].strike;
+    if (strike < target || (pastEqual && strike === target)) {
+      lo = mid + 1;
+    } else {
+      hi = mid;
+    }
+  }
+  return lo;
+}
+
+/**
+ * Slice strike-sorted contracts to [minStrike, maxStrike] by binary search
+ */
+function sliceByStrike(
+  contracts: OptionsContract[],
+  minStrike: number | undefined,
+  maxStrike: number | undefined
+): OptionsContract[] {
+  const start = minStrike === undefined ? 0 : strikeBound(contracts, minStrike, false);
+  const end = maxStrike === undefined ? contracts.length : strikeBound(contracts, maxStrike, true);
+  return contracts.slice(start, Math.max(start, end));
+}
+
+/**
+ * Narrow a chain to contracts within the strike window
+ */
+function applyStrikeRange(chain: OptionsChain, strikeRange: StrikeRange): OptionsChain {
+  const { minStrike, maxStrike } = strikeRange;
+  if (minStrike === undefined && maxStrike === undefined) {
+    return chain;
+  }
+
+  return {
+    ...chain,
+    calls: sliceByStrike(chain.calls, minStrike, maxStrike),
+    puts: sliceByStrike(chain.puts, minStrike, maxStrike),
+  };
+}
+
+// Yahoo omits price/volume fields on illiquid contracts. Dates arrive
+// already parsed by yahoo-finance2's schema validation.
+interface YahooOption {
+  strike: number;
+  lastPrice?: number;
+  bid?: number;
+  ask?: number;
+  change?: number;
+  percentChange?: number;
+  volume?: number;
+  openInterest?: number;
+  impliedVolatility?: number;
+  inTheMoney?: boolean;
+  contractSymbol: string;
+  lastTradeDate: Date;
+}
+
+/**
+ * Normalize one side (calls or puts) of a Yahoo options chain
+ * Only the OptionsContract fields are copied, so the cached chain and its
+ * JSON carry none of Yahoo's extra per-contract fields. Fields Yahoo omits
+ * default to 0. Contracts are returned sorted by strike.
+ */
+function toOptionsContracts(options: YahooOption[] | undefined): OptionsContract[] {
+  const contracts: OptionsContract[] = [];
+  for (const option of options || []) {
+    contracts.push({
+      strike: option.strike,
+      lastPrice: option.lastPrice ?? 0,
+      bid: option.bid ?? 0,
+      ask: option.ask ?? 0,
+      change: option.change ?? 0,
+      percentChange: option.percentChange ?? 0,
+      volume: option.volume ?? 0,
+      openInterest: option.openInterest ?? 0,
+      impliedVolatility: option.impliedVolatility ?? 0,
+      inTheMoney: option.inTheMoney ?? false,
+      contractSymbol: option.contractSymbol,
+      lastTradeDate: option.lastTradeDate,
+    });
+  }
+
+  // Keep strike order guaranteed so strike windows can binary search.
+  // Yahoo already returns ascending strikes, making this a linear pass.
+  contracts.sort((a, b) => a.strike - b.strike);
+
+  return contracts;
+}
+
+/**
+ * Fetch and transform an options chain from Yahoo Finance (uncached)
+ */
+async function fetchOptionsChain(ticker: string, expiration: Date): Promise<OptionsChain | null> {
+  logger.debug('Fetching options chain from Yahoo Finance', { ticker, expirationDate: expiration });
+
+  // Fetch options data for specific expiration
+  const result = await withYahooRateLimit((signal) =>
+    // @ts-expect-error - yahoo-finance2 has complex type overloads that conflict
+    yahooFinance.options(ticker, { date: expiration }, { fetchOptions: { signal } })
+  );
+
+  // Every options response lists all expirations for the ticker; refresh
+  // the shared expirations cache so a later lookup needs no request
+  const expirations = toExpirationDates(result?.expirationDates);
+  if (expirations.length > 0) {
+    cache.set(CacheKeys.optionsExpirations(ticker), expirations, CacheTTL.ONE_HOUR);
+  }
+
+  // Contracts live under options[0] for the requested expiration
+  const optionsData = result?.options?.[0];
+  if (!optionsData || (!optionsData.calls?.length && !optionsData.puts?.length)) {
+    logger.warn('No options chain data returned', { ticker, expirationDate: expiration });
     return null;
   }
+
+  // The options response embeds a live quote for the underlying, so no
+  // separate quote request is needed
+  const underlyingPrice = result.quote?.regularMarketPrice ?? 0;
+
+  // Transform both sides of the chain
+  const calls = toOptionsContracts(optionsData.calls);
+  const puts = toOptionsContracts(optionsData.puts);
+
+  const chainData: OptionsChain = {
+    ticker,
+    expirationDate: expiration,
+    underlyingPrice,
+    calls,
+    puts,
+    fetchedAt: new Date(),
+  };
+
+  logger.info('Options chain fetched successfully', {
+    ticker,
+    expiration: expiration.toISOString().split('T')[0],
+    callsCount: calls.length,
+    putsCount: puts.length,
+    underlyingPrice,
+  });
+
+  return chainData;
 }
 
 /**
@@ -378,11 +678,14 @@ export async function getOptionsExpirations(ticker: string): Promise<Date[] | nu
  *
  * @param ticker Stock symbol
  * @param expirationDate Expiration date (optional - defaults to nearest expiration)
- * @returns Options chain data or null on error
+ * @param strikeRange Optional strike window; contracts outside it are dropped
+ * @returns Options chain data, or null if Yahoo has no chain for it
+ * @throws When the Yahoo request fails and no cached copy is available
  */
 export async function getOptionsChain(
   ticker: string,
-  expirationDate?: Date
+  expirationDate?: Date,
+  strikeRange: StrikeRange = {}
 ): Promise<OptionsChain | null> {
   try {
     // If no expiration provided, get the nearest one
@@ -396,113 +699,29 @@ export async function getOptionsChain(
       targetExpiration = expirations[0]; // Use nearest expiration
     }
 
-    const expirationStr = Math.floor(targetExpiration.getTime() / 1000).toString();
-    const cacheKey = `options_chain_${ticker}_${expirationStr}`;
-
-    // Check cache (5-minute TTL for options data)
-    const cached = cache.get<OptionsChain>(cacheKey);
-    if (cached) {
-      return cached;
-    }
-
-    logger.debug('Fetching options chain from Yahoo Finance', { ticker, expirationDate: targetExpiration });
-
-    // Fetch options data for specific expiration
-    // @ts-expect-error - yahoo-finance2 has complex type overloads that conflict
-    const result = await yahooFinance.options(ticker, { date: targetExpiration });
-
-    if (!result || (!result.calls && !result.puts)) {
-      logger.warn('No options chain data returned', { ticker, expirationDate: targetExpiration });
-      return null;
-    }
-
-    // Get current underlying price from quote
-    const quote = await getTickerInfo(ticker);
-    const underlyingPrice = quote?.regularMarketPrice || 0;
-
-    // Transform calls
-    interface YahooOption {
-      strike: number;
-      lastPrice: number;
-      bid: number;
-      ask: number;
-      change: number;
-      percentChange: number;
-      volume: number;
-      openInterest: number;
-      impliedVolatility: number;
-      inTheMoney: boolean;
-      contractSymbol: string;
-      lastTradeDate: Date;
-    }
-
-    const calls: OptionsContract[] = (result.calls as YahooOption[] || []).map((call) => ({
-      strike: call.strike,
-      lastPrice: call.lastPrice,
-      bid: call.bid,
-      ask: call.ask,
-      change: call.change,
-      percentChange: call.percentChange,
-      volume: call.volume,
-      openInterest: call.openInterest,
-      impliedVolatility: call.impliedVolatility,
-      inTheMoney: call.inTheMoney,
-      contractSymbol: call.contractSymbol,
-      lastTradeDate: new Date(call.lastTradeDate),
-    }));
-
-    // Transform puts
-    const puts: OptionsContract[] = (result.puts as YahooOption[] || []).map((put) => ({
-      strike: put.strike,
-      lastPrice: put.lastPrice,
-      bid: put.bid,
-      ask: put.ask,
-      change: put.change,
-      percentChange: put.percentChange,
-      volume: put.volume,
-      openInterest: put.openInterest,
-      impliedVolatility: put.impliedVolatility,
-      inTheMoney: put.inTheMoney,
-      contractSymbol: put.contractSymbol,
-      lastTradeDate: new Date(put.lastTradeDate),
-    }));
-
-    const chainData: OptionsChain = {
-      ticker,
-      expirationDate: targetExpiration,
-      underlyingPrice,
-      calls,
-      puts,
-      fetchedAt: new Date(),
-    };
+    const expiration = targetExpiration;
+    const cacheKey = optionsChainCacheKey(ticker, expiration);
 
     // Cache for 5 minutes (options data changes frequently during market hours)
-    cache.set(cacheKey, chainData, 5 * 60 * 1000);
+    const chain = await cache.getOrFetch(cacheKey, 5 * 60 * 1000, () =>
+      fetchOptionsChain(ticker, expiration)
+    );
 
-    logger.info('Options chain fetched successfully', {
-      ticker,
-      expiration: targetExpiration.toISOString().split('T')[0],
-      callsCount: calls.length,
-      putsCount: puts.length,
-      underlyingPrice,
-    });
-
-    return chainData;
+    return chain ? applyStrikeRange(chain, strikeRange) : null;
   } catch (error) {
     logger.error('Error fetching options chain', error, { ticker, expirationDate });
 
     // Try to return stale cached data
     if (expirationDate) {
-      const expirationStr = Math.floor(expirationDate.getTime() / 1000).toString();
-      const cacheKey = `options_chain_${ticker}_${expirationStr}`;
+      const cacheKey = optionsChainCacheKey(ticker, expirationDate);
       const staleData = cache.get<OptionsChain>(cacheKey);
       if (staleData) {
         logger.info('Returning stale cached options chain', { ticker });
-        return staleData;
+        return applyStrikeRange(staleData, strikeRange);
       }
     }
 
-    return null;
+    throw error;
   }
 }
 
@@ -1,6 +1,14 @@
 import { type NextRequest, NextResponse } from 'next/server'
 import { updateSession } from '@/lib/supabase/middleware'
 
+// Public routes that don't require authentication
+const publicRoutes = [
+  '/login',
+  '/offline',
+  '/api/auth',
+  '/share/', // Public share links
+]
+
 /**
  * Root middleware for authentication redirects
  *
@@ -11,14 +19,6 @@ import { updateSession } from '@/lib/supabase/middleware'
 export async function middleware(request: NextRequest) {
   const { pathname } = request.nextUrl
 
-  // Public routes that don't require authentication
-  const publicRoutes = [
-    '/login',
-    '/offline',
-    '/api/auth',
-    '/share/', // Public share links
-  ]
-
   const isPublicRoute = publicRoutes.some(route =>
     pathname === route || pathname.startsWith(route)
   )
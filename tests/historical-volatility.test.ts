@@ -0,0 +1,81 @@
+/**
+ * Unit tests for Historical Volatility calculations
+ *
+ * Run: npx jest tests/historical-volatility.test.ts
+ */
+
+import { calculateHV, calculateHVMetrics } from '../src/lib/hv';
+
+// Deterministic zig-zag price series (oldest to newest)
+function makeCloses(count: number): number[] {
+  return Array.from({ length: count }, (_, i) => 100 * (1 + 0.01 * Math.sin(i * 1.7)));
+}
+
+describe('calculateHV', () => {
+  test('returns 0 for a constant growth rate', () => {
+    const closes = Array.from({ length: 10 }, (_, i) => 100 * Math.pow(1.01, i));
+    expect(calculateHV(closes)).toBeCloseTo(0, 8);
+  });
+
+  test('matches the sample stdev formula', () => {
+    // Returns alternate ln(1.1) and ln(1/1.1)
+    const closes = [100, 110, 100, 110, 100];
+    const r = Math.log(1.1);
+    const expected = Math.sqrt((4 * r * r) / 3) * Math.sqrt(252) * 100;
+    expect(calculateHV(closes)).toBeCloseTo(expected, 8);
+  });
+
+  test('returns null for insufficient or invalid data', () => {
+    expect(calculateHV([100])).toBeNull();
+    expect(calculateHV([100, 0, 101])).toBeNull();
+    expect(calculateHV([100, NaN, 101])).toBeNull();
+  });
+});
+
+describe('calculateHVMetrics', () => {
+  test('HV20 and HV30 match calculateHV over the trailing windows', () => {
+    const closes = makeCloses(45);
+    const metrics = calculateHVMetrics(closes);
+
+    expect(metrics.hv20).toBeCloseTo(calculateHV(closes.slice(-20)) as number, 10);
+    expect(metrics.hv30).toBeCloseTo(calculateHV(closes.slice(-30)) as number, 10);
+    expect(metrics.dataPoints).toBe(45);
+  });
+
+  test('only computes HV20 with fewer than 30 closes', () => {
+    const metrics = calculateHVMetrics(makeCloses(25));
+
+    expect(metrics.hv20).not.toBeNull();
+    expect(metrics.hv30).toBeNull();
+  });
+
+  test('ignores invalid prices outside the HV20 window', () => {
+    const closes = makeCloses(30);
+    closes[0] = 0;
+    const metrics = calculateHVMetrics(closes);
+
+    expect(metrics.hv20).toBeCloseTo(calculateHV(closes.slice(-20)) as number, 10);
+    expect(metrics.hv30).toBeNull();
+  });
+
+  test('rejects negative closes even when their log return is finite', () => {
+    // ln(-101 / -100) is finite, so only explicit validation catches this
+    const closes = makeCloses(30);
+    closes[28] = -100;
+    closes[29] = -101;
+    const metrics = calculateHVMetrics(closes);
+
+    expect(metrics.hv20).toBeNull();
+    expect(metrics.hv30).toBeNull();
+  });
+
+  test('keeps HV20 when negative closes are older than its window', () => {
+    const closes = makeCloses(30);
+    closes[2] = -100;
+    closes[3] = -101;
+    const metrics = calculateHVMetrics(closes);
+
+    expect(metrics.hv20).toBeCloseTo(calculateHV(closes.slice(-20)) as number, 10);
+    expect(metrics.hv30).toBeNull();
+  });
+});
@@ -0,0 +1,147 @@
+/**
+ * Unit tests for the market data cache
+ *
+ * Tests in-flight request coalescing used by the Yahoo Finance layer.
+ *
+ * Run: npx jest tests/market-data-marketDataCache.test.ts
+ */
+
+import { cache, CacheKeys, CacheTTL, getPriceCacheTTL, marketDataCache } from '../src/lib/cache';
+
+beforeEach(() => {
+  cache.clearAll();
+  marketDataCache.clearAll();
+});
+
+describe('marketDataCache.getOrFetch', () => {
+  test('returns cached value without calling the fetcher', async () => {
+    marketDataCache.set('key', 'cached', 60_000);
+    const fetcher = jest.fn(async () => 'fresh');
+
+    await expect(marketDataCache.getOrFetch('key', 60_000, fetcher)).resolves.toBe('cached');
+    expect(fetcher).not.toHaveBeenCalled();
+  });
+
+  test('stores the fetched value on a miss', async () => {
+    const fetcher = jest.fn(async () => 'fresh');
+
+    await expect(marketDataCache.getOrFetch('key', 60_000, fetcher)).resolves.toBe('fresh');
+    expect(marketDataCache.get('key')).toBe('fresh');
+  });
+
+  test('coalesces concurrent misses into one fetch', async () => {
+    let resolveFetch: (value: string) => void = () => {};
+    const fetcher = jest.fn(
+      () => new Promise<string>((resolve) => { resolveFetch = resolve; })
+    );
+
+    const first = marketDataCache.getOrFetch('key', 60_000, fetcher);
+    const second = marketDataCache.getOrFetch('key', 60_000, fetcher);
+    resolveFetch('shared');
+
+    await expect(Promise.all([first, second])).resolves.toEqual(['shared', 'shared']);
+    expect(fetcher).toHaveBeenCalledTimes(1);
+  });
+
+  test('does not cache null results', async () => {
+    const fetcher = jest.fn(async () => null);
+
+    await marketDataCache.getOrFetch('key', 60_000, fetcher);
+    await marketDataCache.getOrFetch('key', 60_000, fetcher);
+    expect(fetcher).toHaveBeenCalledTimes(2);
+  });
+
+  test('shares errors with every waiter and allows a retry', async () => {
+    const failing = jest.fn(async () => {
+      throw new Error('rate limited');
+    });
+
+    const results = await Promise.allSettled([
+      marketDataCache.getOrFetch('key', 60_000, failing),
+      marketDataCache.getOrFetch('key', 60_000, failing),
+    ]);
+    expect(results.map((r) => r.status)).toEqual(['rejected', 'rejected']);
+    expect(failing).toHaveBeenCalledTimes(1);
+
+    await expect(marketDataCache.getOrFetch('key', 60_000, async () => 'ok')).resolves.toBe('ok');
+  });
+});
+
+describe('cache bounds', () => {
+  test('evicts the least recently used entry when full', () => {
+    for (let i = 0; i < 1000; i++) {
+      marketDataCache.set(`key_${i}`, i, 60_000);
+    }
+    // Touch the oldest entry so key_1 becomes the eviction candidate
+    expect(marketDataCache.get('key_0')).toBe(0);
+
+    marketDataCache.set('key_new', 'new', 60_000);
+
+    expect(marketDataCache.size()).toBe(1000);
+    expect(marketDataCache.get('key_0')).toBe(0);
+    expect(marketDataCache.get('key_1')).toBeNull();
+    expect(marketDataCache.get('key_new')).toBe('new');
+  });
+
+  test('sweeps expired entries before evicting live ones', () => {
+    for (let i = 0; i < 999; i++) {
+      marketDataCache.set(`key_${i}`, i, 60_000);
+    }
+    marketDataCache.set('expired', 'old', -1);
+    marketDataCache.set('key_999', 999, 60_000);
+
+    expect(marketDataCache.size()).toBe(1000);
+    expect(marketDataCache.get('key_0')).toBe(0);
+    expect(marketDataCache.get('expired')).toBeNull();
+  });
+
+  test('evicts only the oldest entry between sweeps', () => {
+    for (let i = 0; i < 1000; i++) {
+      marketDataCache.set(`key_${i}`, i, 60_000);
+    }
+    // First overflow sweeps; nothing has expired yet
+    marketDataCache.set('key_1000', 1000, 60_000);
+    expect(marketDataCache.get('key_0')).toBeNull();
+
+    // Within the sweep interval the expired entry is not scanned for,
+    // so the least recently used live entry goes instead
+    marketDataCache.set('expired', 'old', -1);
+    expect(marketDataCache.size()).toBe(1000);
+    expect(marketDataCache.get('key_1')).toBeNull();
+    expect(marketDataCache.get('key_2')).toBe(2);
+  });
+
+  test('market data churn cannot evict import sessions', () => {
+    const importKey = CacheKeys.importPreview('token');
+    cache.set(importKey, { rows: 3 }, 15 * 60 * 1000);
+
+    for (let i = 0; i < 2000; i++) {
+      marketDataCache.set(CacheKeys.tickerSearch(`query_${i}`), [], 60_000);
+    }
+
+    expect(marketDataCache.size()).toBe(1000);
+    expect(cache.get(importKey)).toEqual({ rows: 3 });
+  });
+});
+
+describe('getPriceCacheTTL', () => {
+  afterEach(() => {
+    jest.useRealTimers();
+  });
+
+  test('uses Eastern Time market hours regardless of host timezone', () => {
+    jest.useFakeTimers();
+
+    // Monday 10:00 AM ET
+    jest.setSystemTime(new Date('2024-01-08T15:00:00Z'));
+    expect(getPriceCacheTTL()).toBe(CacheTTL.FIVE_MINUTES);
+
+    // Monday 5:00 PM ET
+    jest.setSystemTime(new Date('2024-01-08T22:00:00Z'));
+    expect(getPriceCacheTTL()).toBe(CacheTTL.ONE_HOUR);
+
+    // Saturday 10:00 AM ET
+    jest.setSystemTime(new Date('2024-01-13T15:00:00Z'));
+    expect(getPriceCacheTTL()).toBe(CacheTTL.ONE_DAY);
+  });
+});
@@ -0,0 +1,130 @@
+/**
+ * Unit tests for options chain lookups
+ *
+ * Tests getOptionsChain/getOptionsExpirations against a mocked yahoo-finance2.
+ *
+ * Run: npx jest tests/options-chain.test.ts
+ */
+
+jest.mock('yahoo-finance2', () => ({
+  __esModule: true,
+  default: { options: jest.fn() },
+}));
+
+import yahooFinance from 'yahoo-finance2';
+import { marketDataCache } from '../src/lib/cache';
+import { getOptionsChain, getOptionsExpirations, StrikeRange } from '../src/lib/yahooFinance';
+
+const mockOptions = (yahooFinance as unknown as { options: jest.Mock }).options;
+
+const EXPIRATION = new Date('2025-11-21T00:00:00Z');
+
+function contract(strike: number) {
+  return {
+    strike,
+    contractSymbol: `AAPL251121C${strike}`,
+    lastTradeDate: new Date('2025-11-14T20:00:00Z'),
+    // Extra fields Yahoo sends that OptionsContract does not carry
+    currency: 'USD',
+    contractSize: 'REGULAR',
+  };
+}
+
+function optionsResponse(strikes: number[]) {
+  return {
+    expirationDates: [EXPIRATION],
+    quote: { regularMarketPrice: 175 },
+    options: [{ calls: strikes.map(contract), puts: strikes.map(contract) }],
+  };
+}
+
+// Strikes of the windowed chain; calls and puts must agree
+async function windowStrikes(strikeRange: StrikeRange) {
+  const chain = await getOptionsChain('AAPL', EXPIRATION, strikeRange);
+  const callStrikes = chain?.calls.map((c) => c.strike);
+  expect(chain?.puts.map((p) => p.strike)).toEqual(callStrikes);
+  return callStrikes;
+}
+
+beforeEach(() => {
+  marketDataCache.clearAll();
+  mockOptions.mockReset();
+});
+
+describe('getOptionsChain', () => {
+  test('returns null when Yahoo has no contracts', async () => {
+    mockOptions.mockResolvedValue(optionsResponse([]));
+
+    await expect(getOptionsChain('AAPL', EXPIRATION)).resolves.toBeNull();
+  });
+
+  test('keeps only OptionsContract fields and defaults missing ones', async () => {
+    mockOptions.mockResolvedValue(optionsResponse([175]));
+
+    const chain = await getOptionsChain('AAPL', EXPIRATION);
+    expect(chain?.calls[0]).toEqual({
+      strike: 175,
+      lastPrice: 0,
+      bid: 0,
+      ask: 0,
+      change: 0,
+      percentChange: 0,
+      volume: 0,
+      openInterest: 0,
+      impliedVolatility: 0,
+      inTheMoney: false,
+      contractSymbol: 'AAPL251121C175',
+      lastTradeDate: new Date('2025-11-14T20:00:00Z'),
+    });
+  });
+
+  test('rethrows Yahoo failures when nothing is cached', async () => {
+    mockOptions.mockRejectedValue(new Error('Too Many Requests'));
+
+    await expect(getOptionsChain('AAPL', EXPIRATION)).rejects.toThrow('Too Many Requests');
+  });
+});
+
+describe('getOptionsChain strike windows', () => {
+  test('slices the cached chain for each window', async () => {
+    mockOptions.mockResolvedValue(optionsResponse([160, 165, 170, 175, 180, 185, 190]));
+
+    // Bounds on existing strikes are inclusive on both ends
+    await expect(windowStrikes({ minStrike: 170, maxStrike: 180 })).resolves.toEqual([170, 175, 180]);
+    // Bounds between strikes
+    await expect(windowStrikes({ minStrike: 171, maxStrike: 179 })).resolves.toEqual([175]);
+    // Inverted bounds
+    await expect(windowStrikes({ minStrike: 180, maxStrike: 170 })).resolves.toEqual([]);
+    // Open-ended bounds
+    await expect(windowStrikes({ minStrike: 180 })).resolves.toEqual([180, 185, 190]);
+    await expect(windowStrikes({ maxStrike: 165 })).resolves.toEqual([160, 165]);
+    await expect(windowStrikes({ minStrike: 200 })).resolves.toEqual([]);
+    await expect(windowStrikes({})).resolves.toEqual([160, 165, 170, 175, 180, 185, 190]);
+
+    // Every window is served from one cached fetch
+    expect(mockOptions).toHaveBeenCalledTimes(1);
+  });
+
+  test('keeps every contract at a duplicated strike', async () => {
+    mockOptions.mockResolvedValue(optionsResponse([170, 175, 175, 175, 180]));
+
+    await expect(windowStrikes({ minStrike: 175, maxStrike: 175 })).resolves.toEqual([175, 175, 175]);
+    await expect(windowStrikes({ maxStrike: 175 })).resolves.toEqual([170, 175, 175, 175]);
+    await expect(windowStrikes({ minStrike: 176 })).resolves.toEqual([180]);
+  });
+
+  test('sorts contracts Yahoo returns out of strike order', async () => {
+    mockOptions.mockResolvedValue(optionsResponse([180, 160, 175, 170]));
+
+    await expect(windowStrikes({})).resolves.toEqual([160, 170, 175, 180]);
+    await expect(windowStrikes({ minStrike: 165, maxStrike: 175 })).resolves.toEqual([170, 175]);
+  });
+});
+
+describe('getOptionsExpirations', () => {
+  test('rethrows Yahoo failures when nothing is cached', async () => {
+    mockOptions.mockRejectedValue(new Error('Too Many Requests'));
+
+    await expect(getOptionsExpirations('AAPL')).rejects.toThrow('Too Many Requests');
+  });
+});
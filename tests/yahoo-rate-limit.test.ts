@@ -0,0 +1,133 @@
+/**
+ * Unit tests for the Yahoo Finance request limiter
+ *
+ * Tests concurrency slot handoff, slot release on failure, and that timed-out
+ * calls are aborted and keep their slot until the upstream call settles.
+ *
+ * Run: npx jest tests/yahoo-rate-limit.test.ts
+ */
+
+jest.mock('yahoo-finance2', () => ({ __esModule: true, default: {} }));
+
+import { withYahooRateLimit } from '../src/lib/yahooFinance';
+
+// Yahoo calls that stay pending until the test settles them. With
+// honorAbort they reject when their AbortSignal fires, like a real fetch.
+function pendingCalls(count: number, { honorAbort = false } = {}) {
+  return Array.from({ length: count }, () => {
+    const controls = {
+      settled: false,
+      resolve: (_value: string) => {},
+      reject: (_error: unknown) => {},
+    };
+    const promise = new Promise<string>((resolve, reject) => {
+      controls.resolve = (value) => {
+        controls.settled = true;
+        resolve(value);
+      };
+      controls.reject = (error) => {
+        controls.settled = true;
+        reject(error);
+      };
+    });
+    const call = jest.fn((signal: AbortSignal) => {
+      if (honorAbort) {
+        signal.addEventListener('abort', () => controls.reject(signal.reason));
+      }
+      return promise;
+    });
+    return Object.assign(controls, { call });
+  });
+}
+
+// The token bucket and timeouts both run on timers; keep one fake clock
+// for the whole file so limiter state stays consistent between tests
+beforeAll(() => {
+  jest.useFakeTimers();
+});
+
+afterAll(() => {
+  jest.useRealTimers();
+});
+
+describe('withYahooRateLimit', () => {
+  test('hands freed slots to queued calls in FIFO order', async () => {
+    const calls = pendingCalls(10);
+    const outcomes = calls.map(({ call }) =>
+      withYahooRateLimit(call).catch((error: unknown) => error)
+    );
+
+    // Give the token bucket time to admit everything the slots allow
+    await jest.advanceTimersByTimeAsync(2000);
+    expect(calls.filter(({ call }) => call.mock.calls.length > 0)).toHaveLength(8);
+    expect(calls[8].call).not.toHaveBeenCalled();
+
+    calls[0].resolve('first');
+    await jest.advanceTimersByTimeAsync(0);
+    expect(calls[8].call).toHaveBeenCalled();
+    expect(calls[9].call).not.toHaveBeenCalled();
+
+    // A failing call frees its slot too
+    calls[1].reject(new Error('rate limited'));
+    await jest.advanceTimersByTimeAsync(0);
+    expect(calls[9].call).toHaveBeenCalled();
+
+    calls.slice(2).forEach(({ resolve }) => resolve('done'));
+    const results = await Promise.all(outcomes);
+    expect(results[0]).toBe('first');
+    expect((results[1] as Error).message).toBe('rate limited');
+  });
+
+  test('aborts calls that time out and reuses their slots', async () => {
+    const hung = pendingCalls(8, { honorAbort: true });
+    const outcomes = hung.map(({ call }) =>
+      withYahooRateLimit(call).catch((error: unknown) => error)
+    );
+    const next = jest.fn(async () => 'next');
+    const result = withYahooRateLimit(next);
+
+    await jest.advanceTimersByTimeAsync(2000);
+    expect(next).not.toHaveBeenCalled();
+
+    await jest.advanceTimersByTimeAsync(15000);
+    const errors = await Promise.all(outcomes);
+    errors.forEach((error) => expect((error as Error).name).toBe('TimeoutError'));
+    hung.forEach(({ call, settled }) => {
+      expect(call.mock.calls[0][0].aborted).toBe(true);
+      expect(settled).toBe(true);
+    });
+
+    await expect(result).resolves.toBe('next');
+    expect(next).toHaveBeenCalledTimes(1);
+  });
+
+  test('keeps slots until calls that ignore the abort settle', async () => {
+    const stuck = pendingCalls(8);
+    const outcomes = stuck.map(({ call }) =>
+      withYahooRateLimit(call).catch((error: unknown) => error)
+    );
+    const [next] = pendingCalls(1);
+    const result = withYahooRateLimit(next.call);
+
+    await jest.advanceTimersByTimeAsync(2000);
+    await jest.advanceTimersByTimeAsync(15000);
+    const errors = await Promise.all(outcomes);
+    errors.forEach((error) => expect((error as Error).name).toBe('TimeoutError'));
+
+    // Callers have given up, but no more than 8 upstream calls are pending
+    const pending = [...stuck, next].filter(
+      ({ call, settled }) => call.mock.calls.length > 0 && !settled
+    );
+    expect(pending).toHaveLength(8);
+    expect(next.call).not.toHaveBeenCalled();
+
+    stuck[0].resolve('late');
+    await jest.advanceTimersByTimeAsync(0);
+    expect(next.call).toHaveBeenCalled();
+
+    next.resolve('next');
+    await expect(result).resolves.toBe('next');
+    stuck.slice(1).forEach(({ resolve }) => resolve('late'));
+    await jest.advanceTimersByTimeAsync(0);
+  });
+});